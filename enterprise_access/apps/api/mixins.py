@@ -1,6 +1,8 @@
 """ Mixins for the api app. """
 
 
+import copy
+from collections import OrderedDict
 from functools import cached_property
 
 from edx_rbac import utils
@@ -25,3 +27,29 @@ class UserDetailsFromJwtMixin:
     def user(self):
         # user should always exists
         return User.objects.get(lms_user_id=self.lms_user_id)
+
+
+class CachedFieldsSerializerMixin:
+    """
+    Mixin for serializers that builds the serializer fields only once per serializer class.
+
+    DRF rebuilds (and deep copies) every field each time a serializer is instantiated, which for a
+    ModelSerializer also means introspecting the model. The fields built for a given class never change,
+    so the first result is kept and each new instance gets shallow copies of those fields, which are then
+    bound to it as usual.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        """
+        Returns copies of the fields cached for this serializer class, building them on first use.
+        """
+        serializer_class = type(self)
+        if serializer_class not in self._fields_cache:
+            self._fields_cache[serializer_class] = super().get_fields()
+
+        return OrderedDict(
+            (field_name, copy.copy(field))
+            for field_name, field in self._fields_cache[serializer_class].items()
+        )
@@ -4,6 +4,7 @@ Serializers for Enterprise Access API v1.
 
 from rest_framework import serializers
 
+from enterprise_access.apps.api.mixins import CachedFieldsSerializerMixin
 from enterprise_access.apps.subsidy_request.models import (
     CouponCodeRequest,
     LicenseRequest,
@@ -12,7 +13,7 @@ from enterprise_access.apps.subsidy_request.models import (
 )
 
 
-class SubsidyRequestSerializer(serializers.ModelSerializer):
+class SubsidyRequestSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for the abstract `SubsidyRequest` model.
     """
@@ -24,7 +25,7 @@ class SubsidyRequestSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = SubsidyRequest
-        fields = [
+        fields = (
             'uuid',
             'user',
             'lms_user_id',
@@ -39,8 +40,8 @@ class SubsidyRequestSerializer(serializers.ModelSerializer):
             'decline_reason',
             'created',
             'modified',
-        ]
-        read_only_fields = [
+        )
+        read_only_fields = (
             'uuid',
             'state',
             'lms_user_id',
@@ -51,7 +52,7 @@ class SubsidyRequestSerializer(serializers.ModelSerializer):
             'reviewer_lms_user_id',
             'created',
             'modified',
-        ]
+        )
         extra_kwargs = {
             'user': {'write_only': True},
         }
@@ -64,14 +65,14 @@ class LicenseRequestSerializer(SubsidyRequestSerializer):
 
     class Meta:
         model = LicenseRequest
-        fields = SubsidyRequestSerializer.Meta.fields + [
+        fields = SubsidyRequestSerializer.Meta.fields + (
             'subscription_plan_uuid',
-            'license_uuid'
-        ]
-        read_only_fields = SubsidyRequestSerializer.Meta.read_only_fields + [
+            'license_uuid',
+        )
+        read_only_fields = SubsidyRequestSerializer.Meta.read_only_fields + (
             'subscription_plan_uuid',
-            'license_uuid'
-        ]
+            'license_uuid',
+        )
         extra_kwargs = SubsidyRequestSerializer.Meta.extra_kwargs
 
 
@@ -87,14 +88,14 @@ class CouponCodeRequestSerializer(SubsidyRequestSerializer):
 
     class Meta:
         model = CouponCodeRequest
-        fields = SubsidyRequestSerializer.Meta.fields + [
+        fields = SubsidyRequestSerializer.Meta.fields + (
             'coupon_id',
-            'coupon_code'
-        ]
-        read_only_fields = SubsidyRequestSerializer.Meta.read_only_fields + [
+            'coupon_code',
+        )
+        read_only_fields = SubsidyRequestSerializer.Meta.read_only_fields + (
             'coupon_id',
-            'coupon_code'
-        ]
+            'coupon_code',
+        )
         extra_kwargs = SubsidyRequestSerializer.Meta.extra_kwargs
 
 
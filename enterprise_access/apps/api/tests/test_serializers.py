@@ -0,0 +1,69 @@
+"""
+Tests for Enterprise Access API serializers.
+"""
+
+import ddt
+from django.test import TestCase
+from rest_framework import serializers
+
+from enterprise_access.apps.api.serializers import CouponCodeRequestSerializer, LicenseRequestSerializer
+
+
+@ddt.ddt
+class TestSubsidyRequestSerializerFields(TestCase):
+    """
+    Tests for the cached fields of the subsidy request serializers.
+    """
+
+    @ddt.data(LicenseRequestSerializer, CouponCodeRequestSerializer)
+    def test_fields_are_not_shared_between_instances(self, serializer_class):
+        """
+        Test that each serializer instance gets its own field instances, bound to that serializer.
+        """
+        serializer_1 = serializer_class()
+        serializer_2 = serializer_class()
+
+        assert list(serializer_1.fields) == list(serializer_2.fields)
+        for field_name, field in serializer_1.fields.items():
+            other_field = serializer_2.fields[field_name]
+            assert field is not other_field
+            assert field.parent is serializer_1
+            assert other_field.parent is serializer_2
+
+    @ddt.data(LicenseRequestSerializer, CouponCodeRequestSerializer)
+    def test_cached_fields_match_declared_fields(self, serializer_class):
+        """
+        Test that the cached fields are the same fields DRF would build for the serializer.
+        """
+        # Build the fields once so that the serializer below is served from the cache.
+        assert serializer_class().fields
+        serializer = serializer_class()
+
+        uncached_fields = serializers.ModelSerializer.get_fields(serializer)
+        assert list(serializer.fields) == list(uncached_fields)
+        for field_name, field in serializer.fields.items():
+            assert isinstance(field, type(uncached_fields[field_name]))
+            assert field.read_only == uncached_fields[field_name].read_only
+            assert field.write_only == uncached_fields[field_name].write_only
+
+    def test_fields_are_cached_per_serializer_class(self):
+        """
+        Test that subclasses do not reuse the fields cached for another serializer class.
+        """
+        license_request_fields = LicenseRequestSerializer().fields
+        coupon_code_request_fields = CouponCodeRequestSerializer().fields
+
+        assert 'license_uuid' in license_request_fields
+        assert 'license_uuid' not in coupon_code_request_fields
+        assert 'coupon_code' in coupon_code_request_fields
+        assert 'coupon_code' not in license_request_fields
+
+    @ddt.data(LicenseRequestSerializer, CouponCodeRequestSerializer)
+    def test_user_field_is_write_only(self, serializer_class):
+        """
+        Test that subclasses apply the extra_kwargs of the base serializer, keeping the user field write-only.
+        """
+        fields = serializer_class().fields
+
+        assert fields['user'].write_only
+        assert fields['uuid'].read_only
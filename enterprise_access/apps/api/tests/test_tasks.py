@@ -29,25 +29,26 @@ class TestTasks(APITestWithMocks):
     Test tasks.
     """
 
-    def setUp(self):
-        super().setUp()
-        self.enterprise_customer_uuid_1 = uuid4()
-        self.subsidy_states_to_decline = [
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_customer_uuid_1 = uuid4()
+        cls.subsidy_states_to_decline = [
             SubsidyRequestStates.REQUESTED,
             SubsidyRequestStates.PENDING,
             SubsidyRequestStates.ERROR,
         ]
-        self.license_requests = []
-        self.coupon_code_requests = []
-        for state in self.subsidy_states_to_decline:
-            self.license_requests.append(LicenseRequestFactory(
-                enterprise_customer_uuid=self.enterprise_customer_uuid_1,
-                user=self.user,
+        cls.license_requests = []
+        cls.coupon_code_requests = []
+        for state in cls.subsidy_states_to_decline:
+            cls.license_requests.append(LicenseRequestFactory(
+                enterprise_customer_uuid=cls.enterprise_customer_uuid_1,
+                user=cls.user,
                 state=state
             ))
-            self.coupon_code_requests.append(CouponCodeRequestFactory(
-                enterprise_customer_uuid=self.enterprise_customer_uuid_1,
-                user=self.user,
+            cls.coupon_code_requests.append(CouponCodeRequestFactory(
+                enterprise_customer_uuid=cls.enterprise_customer_uuid_1,
+                user=cls.user,
                 state=state
             ))
 
@@ -193,22 +194,23 @@ class TestLicenseAssignmentTasks(APITestWithMocks):
     Test license assignment tasks.
     """
 
-    def setUp(self):
-        super().setUp()
-        self.enterprise_customer_uuid = uuid4()
-        self.mock_enterprise_learner_data = {
-            self.user.lms_user_id: {
-                'email': self.user.email,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_customer_uuid = uuid4()
+        cls.mock_enterprise_learner_data = {
+            cls.user.lms_user_id: {
+                'email': cls.user.email,
             }
         }
-        self.pending_license_request = LicenseRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid,
-            user=self.user,
+        cls.pending_license_request = LicenseRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid,
+            user=cls.user,
             state=SubsidyRequestStates.PENDING
         )
 
-        self.mock_subscription_uuid = uuid4()
-        self.mock_license_uuid = uuid4()
+        cls.mock_subscription_uuid = uuid4()
+        cls.mock_license_uuid = uuid4()
 
     @mock.patch('enterprise_access.apps.api.tasks.LicenseManagerApiClient')
     def test_assign_license_task(self, mock_license_manager_client):
@@ -270,22 +272,23 @@ class TestCouponCodeAssignmentTasks(APITestWithMocks):
     Test coupon code assignment tasks.
     """
 
-    def setUp(self):
-        super().setUp()
-        self.enterprise_customer_uuid = uuid4()
-        self.mock_enterprise_learner_data = {
-            self.user.lms_user_id: {
-                'email': self.user.email,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_customer_uuid = uuid4()
+        cls.mock_enterprise_learner_data = {
+            cls.user.lms_user_id: {
+                'email': cls.user.email,
             }
         }
-        self.pending_coupon_code_request = CouponCodeRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid,
-            user=self.user,
+        cls.pending_coupon_code_request = CouponCodeRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid,
+            user=cls.user,
             state=SubsidyRequestStates.PENDING
         )
 
-        self.mock_coupon_id = 1
-        self.mock_coupon_code = 'coupon_code'
+        cls.mock_coupon_id = 1
+        cls.mock_coupon_code = 'coupon_code'
 
     @mock.patch('enterprise_access.apps.api.tasks.EcommerceApiClient')
     def test_assign_coupon_codes_task(self, mock_ecommerce_client):
@@ -0,0 +1,58 @@
+"""
+Tests for Enterprise Access API utils.
+"""
+
+from unittest import TestCase
+from uuid import UUID
+
+import ddt
+from rest_framework.exceptions import ParseError
+
+from enterprise_access.apps.api.utils import validate_uuid
+from test_utils import TEST_UUID
+
+
+@ddt.ddt
+class TestValidateUuid(TestCase):
+    """
+    Tests for validate_uuid.
+    """
+
+    @ddt.data(
+        TEST_UUID,
+        TEST_UUID.upper(),
+        TEST_UUID.replace('-', ''),
+        f'{{{TEST_UUID}}}',
+        f'urn:uuid:{TEST_UUID}',
+        f'uuid:{TEST_UUID}',
+        f'urn:uuid:{TEST_UUID.upper()}',
+    )
+    def test_valid_uuid(self, value):
+        """
+        Test that the hex digits, with or without hyphens, are parsed in either case, optionally wrapped
+        in one pair of braces or prefixed by a lower-case ``urn:uuid:`` or ``uuid:``.
+        """
+        assert validate_uuid(value) == UUID(TEST_UUID)
+
+    @ddt.data(
+        '',
+        'hehe-im-not-a-uuid',
+        TEST_UUID[:-1],
+        f'{TEST_UUID}0',
+        f'{TEST_UUID}\n',
+        TEST_UUID.replace('d', 'g'),
+        f'URN:UUID:{TEST_UUID}',
+        f'Urn:uuid:{TEST_UUID}',
+        f'urn:UUID:{TEST_UUID}',
+        f'{{{{{TEST_UUID}}}}}',
+        f'uuid:urn:{TEST_UUID}',
+        None,
+        1,
+        UUID(TEST_UUID),
+    )
+    def test_invalid_uuid(self, value):
+        """
+        Test that a ParseError is raised for anything that is not a uuid string.
+        """
+        with self.assertRaises(ParseError):
+            validate_uuid(value)
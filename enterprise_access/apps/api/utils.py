@@ -2,10 +2,18 @@
 Utility functions for Enterprise Access API.
 """
 
+import re
 from uuid import UUID
 
 from rest_framework.exceptions import ParseError
 
+# Matches the usual hex UUID formats (optional hyphens, a single pair of braces and lower-case urn:/uuid:
+# prefixes, which are the only prefixes ``uuid.UUID`` strips), so that malformed values can be rejected
+# without constructing a UUID and handling its ValueError. Only the hex digits are case-insensitive.
+UUID_REGEX = re.compile(
+    r'(?:urn:)?(?:uuid:)?\{?(?i:[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12})\}?'
+)
+
 
 def get_enterprise_uuid_from_query_params(request):
     """
@@ -17,10 +25,7 @@ def get_enterprise_uuid_from_query_params(request):
     if not enterprise_customer_uuid:
         return None
 
-    try:
-        return UUID(enterprise_customer_uuid)
-    except ValueError as ex:
-        raise ParseError('{} is not a valid uuid.'.format(enterprise_customer_uuid)) from ex
+    return validate_uuid(enterprise_customer_uuid)
 
 def get_enterprise_uuid_from_request_data(request):
     """
@@ -32,17 +37,12 @@ def get_enterprise_uuid_from_request_data(request):
     if not enterprise_customer_uuid:
         return None
 
-    try:
-        return UUID(enterprise_customer_uuid)
-    except ValueError as ex:
-        raise ParseError('{} is not a valid uuid.'.format(enterprise_customer_uuid)) from ex
+    return validate_uuid(enterprise_customer_uuid)
 
 
-# Can use this to replace above logic in other utils functions,
-# but not yet to avoid merge conflicts
 def validate_uuid(uuid):
     """ Check if UUID is valid. If not, raise an error. """
-    try:
-        return UUID(uuid)
-    except ValueError as ex:
-        raise ParseError('{} is not a valid uuid.'.format(uuid)) from ex
+    if not isinstance(uuid, str) or not UUID_REGEX.fullmatch(uuid):
+        raise ParseError(f'{uuid} is not a valid uuid.')
+
+    return UUID(uuid)
@@ -41,6 +41,19 @@ COUPON_CODE_REQUESTS_APPROVE_ENDPOINT = reverse('api:v1:coupon-code-requests-app
 COUPON_CODE_REQUESTS_DECLINE_ENDPOINT = reverse('api:v1:coupon-code-requests-decline')
 CUSTOMER_CONFIGURATIONS_LIST_ENDPOINT = reverse('api:v1:customer-configurations-list')
 
+# Overviews with more than enough licenses/codes left for any approval made in these tests.
+SUBSCRIPTION_OVERVIEW_WITH_LICENSES_REMAINING = [
+    {
+        'status': 'assigned',
+        'count': 13,
+    },
+    {
+        'status': 'unassigned',
+        'count': 100000000,
+    },
+]
+COUPON_OVERVIEW_WITH_CODES_REMAINING = {'num_unassigned': 1000000000}
+
 
 @ddt.ddt
 @mark.django_db
@@ -49,6 +62,12 @@ class TestSubsidyRequestViewSet(APITestWithMocks):
     Tests for SubsidyRequestViewSet.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_customer_uuid_1 = uuid4()
+        cls.enterprise_customer_uuid_2 = uuid4()
+
     def setUp(self):
         super().setUp()
         self.set_jwt_cookie([
@@ -58,40 +77,41 @@ class TestSubsidyRequestViewSet(APITestWithMocks):
             }
         ])
 
-        self.enterprise_customer_uuid_1 = uuid4()
-        self.enterprise_customer_uuid_2 = uuid4()
-
 @ddt.ddt
 class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
     """
     Tests for LicenseRequestViewSet.
     """
 
-    def setUp(self):
-        super().setUp()
-
-        self.set_jwt_cookie([{
-            'system_wide_role': SYSTEM_ENTERPRISE_LEARNER_ROLE,
-            'context': str(self.enterprise_customer_uuid_1),
-        }])
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
         # license requests for the user
-        self.user_license_request_1 = LicenseRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_1,
-            user=self.user
+        cls.user_license_request_1 = LicenseRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_1,
+            user=cls.user
         )
-        self.user_license_request_2 = LicenseRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_2,
-            user=self.user
+        cls.user_license_request_2 = LicenseRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_2,
+            user=cls.user
         )
 
         # license request under the user's enterprise but not for the user
-        self.enterprise_license_request = LicenseRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_1
+        cls.enterprise_license_request = LicenseRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_1
         )
 
         # license request with no associations to the user
-        self.other_license_request = LicenseRequestFactory()
+        cls.other_license_request = LicenseRequestFactory()
+
+    def setUp(self):
+        super().setUp()
+
+        self.set_jwt_cookie([{
+            'system_wide_role': SYSTEM_ENTERPRISE_LEARNER_ROLE,
+            'context': str(self.enterprise_customer_uuid_1),
+        }])
 
     def test_list_as_enterprise_learner(self):
         """
@@ -110,8 +130,7 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
         ])
 
         response = self.client.get(LICENSE_REQUESTS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
-        license_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        license_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_license_request_uuids = sorted([
             str(self.user_license_request_1.uuid),
             str(self.user_license_request_2.uuid)
@@ -129,9 +148,8 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
         }])
 
         response = self.client.get(LICENSE_REQUESTS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
 
-        license_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        license_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_license_request_uuids = sorted([
             str(self.user_license_request_1.uuid),
             str(self.user_license_request_2.uuid),
@@ -139,6 +157,23 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
         ])
         assert license_request_uuids == expected_license_request_uuids
 
+    def test_list_query_count_does_not_scale_with_results(self):
+        """
+        Test that listing requests does not issue extra queries for each request returned.
+        """
+
+        self.set_jwt_cookie([{
+            'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
+            'context': str(self.enterprise_customer_uuid_1)
+        }])
+
+        self.assert_list_query_count_is_constant(
+            LICENSE_REQUESTS_LIST_ENDPOINT,
+            LicenseRequestFactory,
+            expected_before=3,
+            enterprise_customer_uuid=self.enterprise_customer_uuid_1,
+        )
+
     @ddt.data(
         ('', [choice[0] for choice in SubsidyRequestStates.CHOICES]),  # empty values equate to a skipped filter
         (f'{SubsidyRequestStates.PENDING}', [SubsidyRequestStates.PENDING]),
@@ -171,9 +206,8 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
             'state': states
         }
         response = self.client.get(LICENSE_REQUESTS_LIST_ENDPOINT, query_params)
-        response_json = self.load_json(response.content)
 
-        license_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        license_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_license_request_uuids = [
             str(license_request.uuid) for license_request in LicenseRequest.objects.filter(
                 enterprise_customer_uuid=self.enterprise_customer_uuid_1,
@@ -340,7 +374,8 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
             state=SubsidyRequestStates.PENDING
         ).count() == 0
 
-    def test_approve_invalid_subsidy_request_uuid(self):
+    @ddt.data('hehe-im-not-a-uuid', {}, [], None)
+    def test_approve_invalid_subsidy_request_uuid(self, invalid_uuid):
         """ 400 thrown if any subsidy request uuids invalid """
         self.set_jwt_cookie([{
             'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
@@ -352,7 +387,7 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
 
         payload = {
             'enterprise_customer_uuid': self.enterprise_customer_uuid_1,
-            'subsidy_request_uuids': [self.user_license_request_1.uuid, 'hehe-im-not-a-uuid'],
+            'subsidy_request_uuids': [self.user_license_request_1.uuid, invalid_uuid],
             'subscription_plan_uuid': self.user_license_request_1.subscription_plan_uuid,
         }
         response = self.client.post(LICENSE_REQUESTS_APPROVE_ENDPOINT, payload)
@@ -435,9 +470,10 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
             state=SubsidyRequestStates.PENDING
         ).count() == 0
 
+    @mock.patch('enterprise_access.apps.api.v1.views.assign_licenses_task')
     @mock.patch('enterprise_access.apps.api.v1.views.LicenseManagerApiClient.get_subscription_overview')
-    def test_approve_subsidy_request_already_declined(self, mock_get_sub):
-        """ 422 thrown if any subsidy request in payload already declined """
+    def test_approve_duplicate_subsidy_request_uuids(self, mock_get_sub, _):
+        """ Duplicate subsidy request uuids in the payload only count once against the subs remaining """
         self.set_jwt_cookie([{
             'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
             'context': str(self.enterprise_customer_uuid_1)
@@ -449,9 +485,34 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
             },
             {
                 'status': 'unassigned',
-                'count': 100000000,
+                'count': 1,
             },
         ]
+
+        payload = {
+            'enterprise_customer_uuid': self.enterprise_customer_uuid_1,
+            'subsidy_request_uuids': [
+                str(self.user_license_request_1.uuid),
+                str(self.user_license_request_1.uuid).upper(),
+                self.user_license_request_1.uuid.hex,
+            ],
+            'subscription_plan_uuid': self.user_license_request_1.subscription_plan_uuid,
+        }
+        response = self.client.post(LICENSE_REQUESTS_APPROVE_ENDPOINT, payload)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 1
+
+        self.user_license_request_1.refresh_from_db()
+        assert self.user_license_request_1.state == SubsidyRequestStates.PENDING
+
+    @mock.patch('enterprise_access.apps.api.v1.views.LicenseManagerApiClient.get_subscription_overview')
+    def test_approve_subsidy_request_already_declined(self, mock_get_sub):
+        """ 422 thrown if any subsidy request in payload already declined """
+        self.set_jwt_cookie([{
+            'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
+            'context': str(self.enterprise_customer_uuid_1)
+        }])
+        mock_get_sub.return_value = SUBSCRIPTION_OVERVIEW_WITH_LICENSES_REMAINING
         assert LicenseRequest.objects.filter(
             state=SubsidyRequestStates.PENDING
         ).count() == 0
@@ -479,16 +540,7 @@ class TestLicenseRequestViewSet(TestSubsidyRequestViewSet):
             'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
             'context': str(self.enterprise_customer_uuid_1)
         }])
-        mock_get_sub.return_value = [
-            {
-                'status': 'assigned',
-                'count': 13,
-            },
-            {
-                'status': 'unassigned',
-                'count': 100000000,
-            },
-        ]
+        mock_get_sub.return_value = SUBSCRIPTION_OVERVIEW_WITH_LICENSES_REMAINING
         assert LicenseRequest.objects.filter(
             state=SubsidyRequestStates.PENDING
         ).count() == 0
@@ -724,26 +776,27 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
     Tests for CouponCodeRequestViewSet.
     """
 
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
         # coupon code requests for the user
-        self.coupon_code_request_1 = CouponCodeRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_1,
-            user=self.user
+        cls.coupon_code_request_1 = CouponCodeRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_1,
+            user=cls.user
         )
-        self.coupon_code_request_2 = CouponCodeRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_2,
-            user=self.user
+        cls.coupon_code_request_2 = CouponCodeRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_2,
+            user=cls.user
         )
 
         # coupon code request under the user's enterprise but not for the user
-        self.enterprise_coupon_code_request = CouponCodeRequestFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_1
+        cls.enterprise_coupon_code_request = CouponCodeRequestFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_1
         )
 
         # coupon code request with no associations to the user
-        self.other_coupon_code_request = CouponCodeRequestFactory()
+        cls.other_coupon_code_request = CouponCodeRequestFactory()
 
     def test_list_as_enterprise_learner(self):
         """
@@ -762,8 +815,7 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
         ])
 
         response = self.client.get(COUPON_CODE_REQUESTS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
-        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_coupon_code_request_uuids = sorted([
             str(self.coupon_code_request_1.uuid),
             str(self.coupon_code_request_2.uuid)
@@ -781,9 +833,8 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
         }])
 
         response = self.client.get(COUPON_CODE_REQUESTS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
 
-        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_coupon_code_request_uuids = sorted([
             str(self.coupon_code_request_1.uuid),
             str(self.coupon_code_request_2.uuid),
@@ -807,8 +858,7 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
         self.user.save()
 
         response = self.client.get(COUPON_CODE_REQUESTS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
-        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_coupon_code_request_uuids = sorted([
             str(self.coupon_code_request_1.uuid),
             str(self.coupon_code_request_2.uuid),
@@ -830,8 +880,7 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
         ])
 
         response = self.client.get(COUPON_CODE_REQUESTS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
-        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response_json['results']])
+        coupon_code_request_uuids = sorted([lr['uuid'] for lr in response.data['results']])
         expected_coupon_code_request_uuids = sorted([
             str(self.coupon_code_request_1.uuid),
             str(self.coupon_code_request_2.uuid),
@@ -840,6 +889,23 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
         ])
         assert coupon_code_request_uuids == expected_coupon_code_request_uuids
 
+    def test_list_query_count_does_not_scale_with_results(self):
+        """
+        Test that listing requests does not issue extra queries for each request returned.
+        """
+
+        self.set_jwt_cookie([{
+            'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
+            'context': str(self.enterprise_customer_uuid_1)
+        }])
+
+        self.assert_list_query_count_is_constant(
+            COUPON_CODE_REQUESTS_LIST_ENDPOINT,
+            CouponCodeRequestFactory,
+            expected_before=3,
+            enterprise_customer_uuid=self.enterprise_customer_uuid_1,
+        )
+
     def test_create_pending_coupon_code_request_exists(self):
         """
         Test that a 422 response is returned when creating a request if the user
@@ -975,7 +1041,7 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
             'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
             'context': str(self.enterprise_customer_uuid_1)
         }])
-        mock_get_coupon.return_value = {"num_unassigned": 1000000000}
+        mock_get_coupon.return_value = COUPON_OVERVIEW_WITH_CODES_REMAINING
         self.coupon_code_request_1.state = SubsidyRequestStates.DECLINED
         self.coupon_code_request_1.save()
         assert CouponCodeRequest.objects.filter(
@@ -1003,7 +1069,7 @@ class TestCouponCodeRequestViewSet(TestSubsidyRequestViewSet):
             'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
             'context': str(self.enterprise_customer_uuid_1)
         }])
-        mock_get_coupon.return_value = {'num_unassigned': 1000000000}
+        mock_get_coupon.return_value = COUPON_OVERVIEW_WITH_CODES_REMAINING
         assert CouponCodeRequest.objects.filter(
             state=SubsidyRequestStates.PENDING
         ).count() == 0
@@ -1179,6 +1245,16 @@ class TestSubsidyRequestCustomerConfigurationViewSet(APITestWithMocks):
     enterprise_customer_uuid_1 = uuid4()
     enterprise_customer_uuid_2 = uuid4()
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.customer_configuration_1 = SubsidyRequestCustomerConfigurationFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_1
+        )
+        cls.customer_configuration_2 = SubsidyRequestCustomerConfigurationFactory(
+            enterprise_customer_uuid=cls.enterprise_customer_uuid_2
+        )
+
     def setUp(self):
         super().setUp()
         self.set_jwt_cookie([
@@ -1187,12 +1263,6 @@ class TestSubsidyRequestCustomerConfigurationViewSet(APITestWithMocks):
                 'context': ALL_ACCESS_CONTEXT
             }
         ])
-        self.customer_configuration_1 = SubsidyRequestCustomerConfigurationFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_1
-        )
-        self.customer_configuration_2 = SubsidyRequestCustomerConfigurationFactory(
-            enterprise_customer_uuid=self.enterprise_customer_uuid_2
-        )
 
     @ddt.data(
         [{
@@ -1260,10 +1330,9 @@ class TestSubsidyRequestCustomerConfigurationViewSet(APITestWithMocks):
         self.user.save()
 
         response = self.client.get(CUSTOMER_CONFIGURATIONS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
 
         configuration_enterprise_customer_uuids = sorted(
-            [lr['enterprise_customer_uuid'] for lr in response_json['results']]
+            [lr['enterprise_customer_uuid'] for lr in response.data['results']]
         )
         expected_configuration_enterprise_customer_uuids = sorted([
             str(self.customer_configuration_1.enterprise_customer_uuid),
@@ -1287,13 +1356,26 @@ class TestSubsidyRequestCustomerConfigurationViewSet(APITestWithMocks):
         self.set_jwt_cookie(roles_and_contexts)
 
         response = self.client.get(CUSTOMER_CONFIGURATIONS_LIST_ENDPOINT)
-        response_json = self.load_json(response.content)
 
-        configuration_enterprise_customer_uuids = [lr['enterprise_customer_uuid'] for lr in response_json['results']]
+        configuration_enterprise_customer_uuids = [lr['enterprise_customer_uuid'] for lr in response.data['results']]
         expected_configuration_enterprise_customer_uuids = [str(self.customer_configuration_1.enterprise_customer_uuid)]
 
         assert configuration_enterprise_customer_uuids == expected_configuration_enterprise_customer_uuids
 
+    def test_list_query_count_does_not_scale_with_results(self):
+        """
+        Test that listing configurations does not issue extra queries for each configuration returned.
+        """
+        response = self.assert_list_query_count_is_constant(
+            CUSTOMER_CONFIGURATIONS_LIST_ENDPOINT,
+            SubsidyRequestCustomerConfigurationFactory,
+            expected_before=2,
+            changed_by=self.user,
+        )
+        assert [result['changed_by_lms_user_id'] for result in response.data['results'][:5]] == (
+            [self.user.lms_user_id] * 5
+        )
+
     @ddt.data(
         [{
             'system_wide_role': SYSTEM_ENTERPRISE_ADMIN_ROLE,
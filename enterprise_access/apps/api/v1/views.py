@@ -97,6 +97,8 @@ class SubsidyRequestViewSet(UserDetailsFromJwtMixin, viewsets.ModelViewSet):
         """
         Args:
             subsidy_request_uuids: a list of one or more valid uuid strings
+        Returns:
+            the normalized uuid strings, with any duplicates removed (preserving order)
         Raises:
             SubsidyRequestError: if subsidy UUID(s) are not preset or invalid
         """
@@ -105,14 +107,17 @@ class SubsidyRequestViewSet(UserDetailsFromJwtMixin, viewsets.ModelViewSet):
             logger.exception(error_msg)
             raise SubsidyRequestError(error_msg, status.HTTP_400_BAD_REQUEST)
 
+        validated_uuids = []
         for subsidy_request_uuid in subsidy_request_uuids:
             try:
-                validate_uuid(subsidy_request_uuid)
+                validated_uuids.append(str(validate_uuid(subsidy_request_uuid)))
             except ParseError as exc:
                 error_msg = f'Subsidy Request UUID provided ({subsidy_request_uuid}) is not a valid UUID'
                 logger.exception(error_msg)
                 raise SubsidyRequestError(error_msg, status.HTTP_400_BAD_REQUEST) from exc
 
+        return list(dict.fromkeys(validated_uuids))
+
     def _validate_subsidy_request(self):
         """
         Raises:
@@ -151,10 +156,9 @@ class SubsidyRequestViewSet(UserDetailsFromJwtMixin, viewsets.ModelViewSet):
             SubsidyRequestError: if any request has SubsidyRequest state == incorrect_states
         """
 
-        subsidies_in_wrong_state = subsidy_requests.filter(state__in=incorrect_states)
-        if subsidies_in_wrong_state:
-            uuids = [str(uuid) for uuid in list(subsidies_in_wrong_state.values_list('uuid', flat=True))]
-            pretty_uuids = ','.join(uuids)
+        uuids_in_wrong_state = subsidy_requests.filter(state__in=incorrect_states).values_list('uuid', flat=True)
+        if uuids_in_wrong_state:
+            pretty_uuids = ','.join(str(uuid) for uuid in uuids_in_wrong_state)
             pretty_verbs = '/'.join(incorrect_states)
             error_msg = (
                     f'{self.subsidy_type} Request(s) with UUID(s) {pretty_uuids} are already {pretty_verbs}. '
@@ -209,7 +213,7 @@ class LicenseRequestViewSet(SubsidyRequestViewSet):
     Viewset for license requests
     """
 
-    queryset = LicenseRequest.objects.order_by('-created')
+    queryset = LicenseRequest.objects.select_related('user', 'reviewer').order_by('-created')
     serializer_class = serializers.LicenseRequestSerializer
 
     subsidy_type = SubsidyTypeChoices.LICENSE
@@ -300,7 +304,7 @@ class LicenseRequestViewSet(SubsidyRequestViewSet):
         send_notification = self.request.data.get('send_notification', False)
 
         try:
-            self._validate_subsidy_request_uuids(license_request_uuids)
+            license_request_uuids = self._validate_subsidy_request_uuids(license_request_uuids)
             self._validate_subscription_plan_uuid(subscription_plan_uuid)
             self._verify_subsidies_remaining(subscription_plan_uuid, license_request_uuids)
         except SubsidyRequestError as exc:
@@ -324,7 +328,7 @@ class LicenseRequestViewSet(SubsidyRequestViewSet):
 
         license_requests_to_approve = license_requests.filter(
             state__in=[SubsidyRequestStates.REQUESTED, SubsidyRequestStates.ERROR]
-        )
+        ).select_related('user')
         with transaction.atomic():
             for request in license_requests_to_approve:
                 request.approve(self.user)
@@ -374,7 +378,7 @@ class LicenseRequestViewSet(SubsidyRequestViewSet):
         unlink_users_from_enterprise = self.request.data.get('unlink_users_from_enterprise', False)
 
         try:
-            self._validate_subsidy_request_uuids(license_request_uuids)
+            license_request_uuids = self._validate_subsidy_request_uuids(license_request_uuids)
         except SubsidyRequestError as exc:
             logger.exception(exc)
             return Response(exc.message, exc.http_status_code)
@@ -446,7 +450,7 @@ class CouponCodeRequestViewSet(SubsidyRequestViewSet):
     Viewset for coupon code requests
     """
 
-    queryset = CouponCodeRequest.objects.order_by('-created')
+    queryset = CouponCodeRequest.objects.select_related('user', 'reviewer').order_by('-created')
     serializer_class = serializers.CouponCodeRequestSerializer
 
     subsidy_type = SubsidyTypeChoices.COUPON
@@ -510,7 +514,7 @@ class CouponCodeRequestViewSet(SubsidyRequestViewSet):
         send_notification = self.request.data.get('send_notification', False)
 
         try:
-            self._validate_subsidy_request_uuids(coupon_code_request_uuids)
+            coupon_code_request_uuids = self._validate_subsidy_request_uuids(coupon_code_request_uuids)
             self._validate_redemptions_remaining(enterprise_customer_uuid, coupon_id, coupon_code_request_uuids)
         except SubsidyRequestError as exc:
             logger.exception(exc)
@@ -533,7 +537,7 @@ class CouponCodeRequestViewSet(SubsidyRequestViewSet):
 
         coupon_code_requests_to_approve = coupon_code_requests.filter(
             state__in=[SubsidyRequestStates.REQUESTED, SubsidyRequestStates.ERROR]
-        )
+        ).select_related('user')
         with transaction.atomic():
             for coupon_code_request in coupon_code_requests_to_approve:
                 coupon_code_request.approve(self.user)
@@ -583,7 +587,7 @@ class CouponCodeRequestViewSet(SubsidyRequestViewSet):
         unlink_users_from_enterprise = self.request.data.get('unlink_users_from_enterprise', False)
 
         try:
-            self._validate_subsidy_request_uuids(coupon_code_request_uuids)
+            coupon_code_request_uuids = self._validate_subsidy_request_uuids(coupon_code_request_uuids)
         except SubsidyRequestError as exc:
             logger.exception(exc)
             return Response(exc.message, exc.http_status_code)
@@ -664,7 +668,7 @@ class SubsidyRequestCustomerConfigurationViewSet(UserDetailsFromJwtMixin, viewse
     filterset_fields = ('enterprise_customer_uuid', 'subsidy_requests_enabled', 'subsidy_type',)
     pagination_class = PaginationWithPageCount
 
-    queryset = SubsidyRequestCustomerConfiguration.objects.order_by('-created')
+    queryset = SubsidyRequestCustomerConfiguration.objects.select_related('changed_by').order_by('-created')
 
     http_method_names = ['get', 'post', 'patch']
 
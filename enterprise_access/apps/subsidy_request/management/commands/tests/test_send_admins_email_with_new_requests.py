@@ -21,10 +21,11 @@ class TestManagementCommands(APITestWithMocks):
     Tests for Subsidy Request Management Commands.
     """
 
-    def setUp(self):
-        super().setUp()
-        self.enterprise_customer_uuid = uuid4()
-        self.admin_users = [
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.enterprise_customer_uuid = uuid4()
+        cls.admin_users = [
             {
                 'lms_user_id': 1,
                 'email': 'pieguy@example.com',
@@ -16,6 +16,11 @@ DATABASES = {
 }
 # END IN-MEMORY TEST DATABASE
 
+# Tests don't need a secure password hash, and the default hasher makes creating users slow.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
 # BEGIN CELERY
 CELERY_BROKER_URL = "memory://"
 CELERY_TASK_ALWAYS_EAGER = True
@@ -8,7 +8,8 @@ in multiple test modules (i.e. factoryboy factories, base test classes).
 
 So this package is the place to put them.
 """
-import json
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 import mock
 from pytest import mark
 from rest_framework.test import APIClient, APITestCase
@@ -39,12 +40,19 @@ class APITest(APITestCase):
     Base class for API Tests.
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the test user once for all tests in the class.
+        """
+        super().setUpTestData()
+        cls.create_user(username=TEST_USERNAME, email=TEST_EMAIL, password=TEST_PASSWORD)
+
     def setUp(self):
         """
         Perform operations common to all tests.
         """
         super().setUp()
-        self.create_user(username=TEST_USERNAME, email=TEST_EMAIL, password=TEST_PASSWORD)
         self.client = APIClient()
         self.client.login(username=TEST_USERNAME, password=TEST_PASSWORD)
 
@@ -56,27 +64,31 @@ class APITest(APITestCase):
         self.client.logout()
         super().tearDown()
 
-    def create_user(self, username=TEST_USERNAME, password=TEST_PASSWORD, is_staff=False, **kwargs):
+    @classmethod
+    def create_user(cls, username=TEST_USERNAME, password=TEST_PASSWORD, is_staff=False, **kwargs):
         """
         Create a test user and set its password.
         """
-        self.user = UserFactory(username=username, is_active=True, is_staff=is_staff,  **kwargs)
-        self.user.set_password(password)
-        self.user.save()
+        cls.user = UserFactory(username=username, password=password, is_active=True, is_staff=is_staff, **kwargs)
 
-    def load_json(self, content):
+    def assert_list_query_count_is_constant(self, endpoint, factory, expected_before, extra=5, **factory_kwargs):
         """
-        Parse content from django Response object.
+        Assert that listing ``endpoint`` issues no extra queries once ``factory`` has created ``extra`` more results.
 
-        Arguments:
-            content (bytes | str) : content type id bytes for PY3 and is string for PY2
-
-        Returns:
-            dict object containing parsed json from response.content
+        Returns the response of the final list request.
         """
-        if isinstance(content, bytes):
-            content = content.decode('utf-8')
-        return json.loads(content)
+        # The first request may create the JWT user, so only count queries from the second one.
+        self.client.get(endpoint)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(endpoint)
+        assert len(response.data['results']) == expected_before
+
+        factory.create_batch(extra, **factory_kwargs)
+
+        with self.assertNumQueries(len(queries)):
+            response = self.client.get(endpoint)
+        assert len(response.data['results']) == expected_before + extra
+        return response
 
     def get_request_with_jwt_cookie(self, system_wide_role=None, context=None):
         """
@@ -131,21 +143,38 @@ class APITestWithMocks(APITest):
     API test class with discovery api calls in subsidy_request tasks mocked out.
 
     We call discovery on every SubsidyRequest object save().
+
+    The patchers are started once per class (before setUpTestData runs). Before each test the mocks are reset,
+    including any return_value or side_effect a test set, and the default course data is restored.
     """
-    def setUp(self):
-        super().setUp()
-        self.disco_patcher = mock.patch('enterprise_access.apps.subsidy_request.tasks.DiscoveryApiClient')
-        self.mock_discovery_client = self.disco_patcher.start()
-        self.mock_discovery_client().get_course_data.return_value = {
+    @classmethod
+    def setUpClass(cls):
+        cls.disco_patcher = mock.patch('enterprise_access.apps.subsidy_request.tasks.DiscoveryApiClient')
+        cls.mock_discovery_client = cls.disco_patcher.start()
+        cls.addClassCleanup(cls.disco_patcher.stop)
+        cls.set_default_course_data()
+
+        cls.analytics_patcher = mock.patch('analytics.track')
+        cls.mock_analytics = cls.analytics_patcher.start()
+        cls.addClassCleanup(cls.analytics_patcher.stop)
+
+        super().setUpClass()
+
+    @classmethod
+    def set_default_course_data(cls):
+        """
+        Make the mocked discovery client return the default course data.
+        """
+        cls.mock_discovery_client().get_course_data.return_value = {
             'title': COURSE_TITLE_ABOUT_PIE,
             'owners': [{'uuid': TEST_PARTER_UUID, 'name': TEST_PARTNER_NAME}],
         }
 
-        self.analytics_patcher = mock.patch('analytics.track')
-        self.mock_analytics = self.analytics_patcher.start()
-
-        self.addCleanup(self.disco_patcher.stop)
-        self.addCleanup(self.analytics_patcher.stop)
+    def setUp(self):
+        super().setUp()
+        self.mock_discovery_client.reset_mock(return_value=True, side_effect=True)
+        self.mock_analytics.reset_mock(return_value=True, side_effect=True)
+        self.set_default_course_data()
 
 
 class TestCaseWithMockedDiscoveryApiClient(TestCase):